@@ -0,0 +1,121 @@
+# benchmarks/generator.py
+
+import random
+
+class ProgramGenerator:
+    """Gera programas sintética e semanticamente válidos a partir de uma semente."""
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+
+    def generate(self, statements=100, functions=10, params=3, depth=3, leaf_functions=None, repeated=0):
+        """
+        Gera o código-fonte de um programa.
+
+        statements: número de atribuições no fluxo principal
+        functions: número de declarações de função
+        params: número de parâmetros de cada função (e de argumentos em cada chamada)
+        depth: profundidade de aninhamento das expressões
+        leaf_functions: funções que não chamam outras (as demais só chamam estas,
+                        o que limita a profundidade de chamadas durante a execução)
+        repeated: se maior que zero, as expressões combinam subexpressões de um
+                  conjunto fixo desse tamanho, repetindo-as ao longo do programa
+        """
+        if repeated:
+            return self._generate_repeated(statements, functions, params, depth, repeated)
+        if leaf_functions is None:
+            leaf_functions = max(1, functions // 4)
+        self.functions = [] # Pares (nome, número de parâmetros) já declarados
+        self.leaves = []
+        self.variables = []
+        lines = []
+
+        for index in range(functions):
+            name = f"f{index}"
+            param_names = [f"p{i}" for i in range(params)]
+            callees = [] if index < leaf_functions else self.leaves
+            body = self._expression(depth, param_names, callees)
+            lines.append(f"funcao {name}({', '.join(param_names)}) = {body}")
+            self.functions.append((name, params))
+            if index < leaf_functions:
+                self.leaves.append((name, params))
+
+        for index in range(statements):
+            name = f"v{index}"
+            value = self._expression(depth, self.variables[-8:], self.functions)
+            lines.append(f"{name} = {value}")
+            self.variables.append(name)
+
+        return "\n".join(lines) + "\n"
+
+    def _generate_repeated(self, statements, functions, params, depth, repeated):
+        """Programa em que as mesmas subexpressões aparecem muitas vezes."""
+        param_names = [f"p{i}" for i in range(params)]
+        body_pool = [self._expression(depth, param_names, []) for _ in range(repeated)]
+        self.functions = [(f"f{index}", params) for index in range(functions)]
+        lines = [f"funcao {name}({', '.join(param_names)}) = ({self.random.choice(body_pool)}) + "
+                 f"({self.random.choice(body_pool)})" for name, _ in self.functions]
+
+        # As sentenças usam sempre as mesmas variáveis, definidas no início
+        self.variables = [f"v{index}" for index in range(min(8, statements))]
+        lines.extend(f"{name} = {self._literal()}" for name in self.variables)
+        pool = [self._expression(depth, self.variables, self.functions) for _ in range(repeated)]
+        for index in range(len(self.variables), statements):
+            lines.append(f"v{index} = ({self.random.choice(pool)}) {self.random.choice(['+', '-'])} ({self.random.choice(pool)})")
+
+        return "\n".join(lines) + "\n"
+
+    def _literal(self):
+        if self.random.random() < 0.5:
+            return str(self.random.randint(1, 100))
+        return f"{self.random.uniform(0.5, 2.0):.2f}"
+
+    def _leaf(self, names):
+        if names and self.random.random() < 0.7:
+            return self.random.choice(names)
+        return self._literal()
+
+    def _call(self, names, callees, first=None):
+        name, arity = self.random.choice(callees)
+        args = [self._expression(1, names, []) for _ in range(arity)]
+        if first is not None and args:
+            # O primeiro argumento carrega o restante do aninhamento
+            args[0] = first
+        return f"{name}({', '.join(args)})"
+
+    def _expression(self, depth, names, callees):
+        """Expressão encadeada com 'depth' níveis de aninhamento."""
+        if depth <= 0:
+            if callees and self.random.random() < 0.2:
+                return self._call(names, callees)
+            return self._leaf(names)
+
+        inner = self._expression(depth - 1, names, callees)
+        choice = self.random.random()
+        if choice < 0.1:
+            return f"-({inner})"
+        if choice < 0.2 and callees:
+            return self._call(names, callees, inner)
+        # Multiplicação e divisão só por literais reais em [0.5, 2], evitando crescimento
+        # descontrolado dos valores e divisão por zero
+        op = self.random.choice(['+', '-', '*', '/', '^'])
+        if op in ('*', '/'):
+            return f"({inner}) {op} {self.random.uniform(0.5, 2.0):.2f}"
+        if op == '^':
+            return f"({inner}) + {self.random.randint(1, 3)} ^ 2"
+        return f"({inner}) {op} {self._leaf(names)}"
+
+# Perfis de carga: cada um escala uma dimensão do programa a partir do tamanho n
+WORKLOADS = {
+    'sentencas': lambda n: {'statements': n, 'functions': 10, 'params': 3, 'depth': 3},
+    'funcoes_largas': lambda n: {'statements': 50, 'functions': 20, 'params': max(1, n // 10), 'depth': 2},
+    'aninhamento': lambda n: {'statements': 20, 'functions': 4, 'params': 2, 'depth': max(1, n // 10)},
+    'muitas_funcoes': lambda n: {'statements': n // 10, 'functions': n, 'params': 3, 'depth': 4},
+    'repetitivo': lambda n: {'statements': n, 'functions': n // 10, 'params': 3, 'depth': 4, 'repeated': 20},
+}
+
+def generate_workload(workload, size, seed=0):
+    """Gera o programa do perfil de carga 'workload' com tamanho 'size'."""
+    return ProgramGenerator(seed).generate(**WORKLOADS[workload](size))
+
+if __name__ == '__main__':
+    print(generate_workload('sentencas', 10))
@@ -0,0 +1,239 @@
+# benchmarks/run_benchmarks.py
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+# Adiciona a raiz do projeto ao path para importar o pacote src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import lexer
+from src.parser import parse
+from src.semantic_analyzer import SemanticAnalyzer
+from src.intermediate_code_gen import IntermediateCodeGenerator
+from src.executor import Executor
+from benchmarks.generator import WORKLOADS, generate_workload
+
+DEFAULT_SIZES = [250, 500, 1000, 2000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Diferenças abaixo destes limites são tratadas como ruído de medição
+MIN_TIME = 0.005 # segundos
+MIN_MEMORY = 64 * 1024 # bytes
+
+# Fases cujo tempo depende do número de processadores
+PARALLEL_PHASES = ('semantico_paralelo', 'codigo_intermediario_paralelo')
+
+def _tokenize(source):
+    lexer.lineno = 1
+    lexer.input(source)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+def _parse(source, hash_cons=False):
+    return parse(source, lexer, hash_cons=hash_cons)[0]
+
+def _analyze(ast, parallel=False):
+    SemanticAnalyzer().analyze(ast, parallel=parallel)
+
+def _generate(ast, parallel=False):
+    generator = IntermediateCodeGenerator()
+    code = generator.generate(ast, parallel=parallel)
+    return code, generator.function_signatures
+
+def _execute(program, memoize=False):
+    code, signatures = program
+    return Executor(code, signatures, memoize=memoize).run()
+
+def build_phases(source):
+    """Fases medidas, cada uma com a entrada produzida pela fase anterior."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = _parse(source)
+        shared_ast = _parse(source, hash_cons=True)
+        program = _generate(ast)
+    return [
+        ('lexer', lambda: _tokenize(source)),
+        ('parser', lambda: _parse(source)),
+        ('semantico', lambda: _analyze(ast)),
+        ('codigo_intermediario', lambda: _generate(ast)),
+        # O pico de memória das fases paralelas inclui apenas o processo principal
+        ('semantico_paralelo', lambda: _analyze(ast, parallel=True)),
+        ('codigo_intermediario_paralelo', lambda: _generate(ast, parallel=True)),
+        # Com hash-consing, o pico de memória do parser inclui a AST compartilhada
+        ('parser_hash_cons', lambda: _parse(source, hash_cons=True)),
+        ('semantico_hash_cons', lambda: _analyze(shared_ast)),
+        ('codigo_intermediario_hash_cons', lambda: _generate(shared_ast)),
+        ('execucao', lambda: _execute(program)),
+        ('execucao_memo', lambda: _execute(program, memoize=True)),
+    ]
+
+def measure(function, repeats):
+    """Retorna o menor tempo entre as repetições e o pico de memória de uma execução."""
+    best = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            started = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - started)
+        # O tracemalloc torna a execução mais lenta, por isso é medido à parte
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+def calibrate(repeats=5):
+    """Tempo de um laço fixo, usado para normalizar medições entre máquinas diferentes."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        total = 0
+        for i in range(200000):
+            total += i * i
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def run(workloads, sizes, repeats, seed):
+    results = {}
+    for workload in workloads:
+        results[workload] = {}
+        for size in sizes:
+            source = generate_workload(workload, size, seed)
+            results[workload][str(size)] = {}
+            for phase, function in build_phases(source):
+                elapsed, peak = measure(function, repeats)
+                results[workload][str(size)][phase] = {'time': elapsed, 'peak': peak}
+                print(f"{workload:<16}{size:>8}  {phase:<34}{elapsed * 1000:>10.2f} ms{peak / 1024:>12.1f} KiB")
+    return results
+
+def scaling_exponents(results):
+    """Expoente k de tempo ~ tamanho^k entre o menor e o maior tamanho medidos."""
+    exponents = {}
+    for workload, by_size in results.items():
+        sizes = sorted(by_size, key=int)
+        if len(sizes) < 2:
+            continue
+        first, last = sizes[0], sizes[-1]
+        exponents[workload] = {}
+        for phase in by_size[first]:
+            t0, t1 = by_size[first][phase]['time'], by_size[last][phase]['time']
+            if t0 > 0 and t1 > 0:
+                exponents[workload][phase] = math.log(t1 / t0) / math.log(int(last) / int(first))
+    return exponents
+
+def speedups(results):
+    """Razão entre os tempos serial e paralelo da análise semântica e da geração de código."""
+    ratios = {}
+    for workload, by_size in results.items():
+        ratios[workload] = {}
+        for size, phases in by_size.items():
+            ratios[workload][size] = (
+                phases['semantico']['time'] / phases['semantico_paralelo']['time'],
+                phases['codigo_intermediario']['time'] / phases['codigo_intermediario_paralelo']['time'],
+            )
+    return ratios
+
+def compare(results, calibration, baseline, tolerance, memory_tolerance):
+    """
+    Lista as regressões de tempo (normalizado pela calibração) e de memória,
+    e conta as medições comparadas. As fases paralelas só são comparadas com
+    uma referência medida com o mesmo número de processadores.
+    """
+    regressions = []
+    compared = 0
+    scale = calibration / baseline['calibration']
+    same_cpus = baseline.get('cpu_count') == os.cpu_count()
+    for workload, by_size in results.items():
+        for size, phases in by_size.items():
+            for phase, current in phases.items():
+                reference = baseline['results'].get(workload, {}).get(size, {}).get(phase)
+                if reference is None or (phase in PARALLEL_PHASES and not same_cpus):
+                    continue
+                compared += 1
+                expected_time = reference['time'] * scale
+                if current['time'] > expected_time * (1 + tolerance) and current['time'] - expected_time > MIN_TIME:
+                    regressions.append(f"{workload}/{size}/{phase}: tempo {current['time'] * 1000:.2f} ms "
+                                       f"(referência {expected_time * 1000:.2f} ms)")
+                if current['peak'] > reference['peak'] * (1 + memory_tolerance) and current['peak'] - reference['peak'] > MIN_MEMORY:
+                    regressions.append(f"{workload}/{size}/{phase}: memória {current['peak'] / 1024:.1f} KiB "
+                                       f"(referência {reference['peak'] / 1024:.1f} KiB)")
+    return regressions, compared
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmarks das fases do compilador.")
+    arg_parser.add_argument('--workloads', nargs='+', choices=sorted(WORKLOADS), default=sorted(WORKLOADS))
+    arg_parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    arg_parser.add_argument('--repeats', type=int, default=3)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    arg_parser.add_argument('--save-baseline', action='store_true', help="Grava os resultados como nova referência")
+    arg_parser.add_argument('--tolerance', type=float, default=0.5, help="Aumento de tempo tolerado (0.5 = 50%%)")
+    arg_parser.add_argument('--memory-tolerance', type=float, default=0.2, help="Aumento de memória tolerado")
+    arg_parser.add_argument('--output', help="Grava os resultados em JSON")
+    args = arg_parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000)) # Expressões profundamente aninhadas
+
+    calibration = calibrate()
+    results = run(args.workloads, args.sizes, args.repeats, args.seed)
+    report = {'calibration': calibration, 'cpu_count': os.cpu_count(), 'seed': args.seed, 'results': results}
+
+    print("\n--- Escalonamento (tempo ~ tamanho^k) ---")
+    for workload, phases in scaling_exponents(results).items():
+        for phase, exponent in phases.items():
+            print(f"{workload:<16}{phase:<34}k = {exponent:.2f}")
+
+    print(f"\n--- Aceleração da fase paralela ({os.cpu_count()} processadores) ---")
+    if os.cpu_count() == 1:
+        print("Com um único processador, o modo paralelo segue o caminho serial.")
+    for workload, phases in speedups(results).items():
+        for size, (semantic, generation) in phases.items():
+            print(f"{workload:<16}{size:>8}  semantico x{semantic:.2f}  codigo_intermediario x{generation:.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReferência gravada em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nReferência não encontrada em {args.baseline}; use --save-baseline para criá-la.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('cpu_count') != os.cpu_count():
+        print(f"\nReferência medida com {baseline.get('cpu_count', '?')} processador(es); "
+              "as fases paralelas não são comparadas.")
+    regressions, compared = compare(results, calibration, baseline, args.tolerance, args.memory_tolerance)
+    if not compared:
+        # Sem medições correspondentes (perfis ou tamanhos fora da referência), nada foi verificado
+        print("\nNenhum resultado pôde ser comparado com a referência; verifique --workloads e --sizes.")
+        return 1
+    total = sum(len(phases) for by_size in results.values() for phases in by_size.values())
+    if compared < total:
+        print(f"\n{total - compared} de {total} medições não foram comparadas com a referência.")
+    if regressions:
+        print("\n--- Regressões ---")
+        for regression in regressions:
+            print(regression)
+        return 1
+    print("\nNenhuma regressão em relação à referência.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,16 @@
+# src/diagnostics.py
+
+def diagnostic(phase, message, line=None, column=None):
+    """Cria um diagnóstico estruturado (fase: 'lexico', 'sintatico' ou 'semantico')."""
+    return {'phase': phase, 'message': message, 'line': line, 'column': column}
+
+def find_column(data, lexpos):
+    """Coluna (a partir de 1) de uma posição absoluta no código-fonte."""
+    line_start = data.rfind('\n', 0, lexpos) + 1
+    return lexpos - line_start + 1
+
+def format_diagnostic(entry):
+    """Representação em texto de um diagnóstico."""
+    if entry['line'] is None:
+        return entry['message']
+    return f"[linha {entry['line']}, coluna {entry['column']}] {entry['message']}"
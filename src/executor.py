@@ -0,0 +1,242 @@
+# src/executor.py
+
+from collections import OrderedDict
+import math
+
+# Maior resultado (em bits) aceito numa potência de inteiros; acima disso o cálculo
+# pode não terminar em tempo razoável (ex.: 9 ^ 9 ^ 9)
+MAX_POWER_BITS = 10000
+
+# Sentinela para diferenciar "não encontrado no cache" de um resultado válido
+_MISS = object()
+
+class FunctionCache:
+    """Cache LRU limitado para os resultados de uma função pura."""
+    def __init__(self, max_size=128, min_hit_rate=0.1, warmup=64):
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.min_hit_rate = min_hit_rate # Taxa mínima de acertos para manter o cache ativo
+        self.warmup = warmup # Número de consultas antes de avaliar a taxa de acertos
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = False
+
+    def get(self, key):
+        """Retorna o valor associado à chave ou _MISS, atualizando a ordem LRU."""
+        value = self.entries.get(key, _MISS)
+        if value is _MISS:
+            self.misses += 1
+            self._check_bypass()
+            return _MISS
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Armazena um resultado, descartando a entrada menos usada se necessário."""
+        if self.bypassed or self.max_size <= 0:
+            return
+        self.entries[key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _check_bypass(self):
+        """Desativa o cache de funções cujos argumentos quase nunca se repetem."""
+        if self.hits + self.misses >= self.warmup and self.hit_rate() < self.min_hit_rate:
+            self.bypassed = True
+            self.entries.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'hit_rate': self.hit_rate(),
+            'bypassed': self.bypassed,
+        }
+
+class Executor:
+    """Interpreta o código intermediário (quádruplas) gerado a partir da AST."""
+    def __init__(self, code, function_signatures, memoize=False, cache_size=128,
+                 min_hit_rate=0.1, warmup=64, profiler=None):
+        self.code = code
+        self.function_signatures = function_signatures
+        self.memoize = memoize
+        self.cache_size = cache_size
+        self.min_hit_rate = min_hit_rate
+        self.warmup = warmup
+        self.globals = {}
+        self.functions = {} # func_id -> índice da primeira instrução do corpo
+        self.function_ends = {} # índice do LABEL -> índice do END_FUNC
+        self.free_names = {} # func_id -> variáveis globais lidas (direta ou indiretamente)
+        self.variables = {} # Variáveis atribuídas pelo programa (exclui temporários)
+        self.caches = {}
+        self.profiler = profiler # Profiler opcional; sem ele a execução não é instrumentada
+        self._index_functions()
+
+    def _index_functions(self):
+        """Localiza os corpos das funções e as variáveis globais de que cada uma depende."""
+        start = None
+        for index, (op, arg1, arg2, result) in enumerate(self.code):
+            if op == 'LABEL' and result.startswith('FUNC_'):
+                start = index
+            elif op == 'END_FUNC':
+                self.functions[result] = start + 1
+                self.function_ends[start] = index
+                self.free_names[result] = self._collect_free_names(result, start + 1, index)
+                start = None
+            elif op == '=' and start is None:
+                self.variables[result] = True
+
+    def _collect_free_names(self, func_id, start, end):
+        """Um resultado só pode ser reaproveitado se os globais lidos pela função não mudaram."""
+        params = set(self.function_signatures.get(func_id, {}).get('params', []))
+        defined = set()
+        names = set()
+        for op, arg1, arg2, result in self.code[start:end]:
+            if op == 'CALL':
+                # Funções são declaradas antes do uso, exceto a própria (recursão)
+                names.update(self.free_names.get(arg1, ()))
+                operands = ()
+            else:
+                operands = (arg1, arg2)
+            for operand in operands:
+                if isinstance(operand, str) and operand not in params and operand not in defined:
+                    names.add(operand)
+            if isinstance(result, str) and op not in ('LABEL', 'END_FUNC'):
+                defined.add(result)
+        return tuple(sorted(names))
+
+    def run(self):
+        """Executa o programa e retorna as variáveis globais resultantes."""
+        print("--- Execução ---")
+        self.globals = {}
+        self.caches = {}
+        if self.profiler is not None:
+            self.profiler.start()
+        try:
+            self._run_block(0, self.globals)
+        except RecursionError:
+            raise Exception("Erro de Execução: Profundidade máxima de recursão excedida.") from None
+        except ZeroDivisionError:
+            raise Exception("Erro de Execução: Divisão por zero.") from None
+        except OverflowError:
+            raise Exception("Erro de Execução: Resultado numérico fora do intervalo representável.") from None
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
+        print("Execução Concluída.")
+        return {name: self.globals[name] for name in self.variables}
+
+    def _value(self, operand, env):
+        """Resolve um operando: literal, temporário/parâmetro local ou variável global."""
+        if not isinstance(operand, str):
+            return operand
+        if operand in env:
+            return env[operand]
+        if operand in self.globals:
+            return self.globals[operand]
+        raise Exception(f"Erro de Execução: Variável '{operand}' sem valor.")
+
+    def _run_block(self, index, env):
+        """Executa instruções a partir de index até um RETURN (ou o fim do código)."""
+        code = self.code
+        counts = self.profiler.instruction_counts if self.profiler is not None else None
+        pending_args = []
+        while index < len(code):
+            op, arg1, arg2, result = code[index]
+            if op == 'LABEL':
+                # Declarações de função não são executadas no fluxo principal
+                index = self.function_ends.get(index, index) + 1
+                continue
+            if counts is not None:
+                counts[index] += 1
+            if op == 'RETURN':
+                return self._value(arg1, env)
+            if op == '=':
+                env[result] = self._value(arg1, env)
+            elif op == 'PARAM':
+                pending_args.append(self._value(arg1, env))
+            elif op == 'CALL':
+                args = pending_args[len(pending_args) - arg2:]
+                del pending_args[len(pending_args) - arg2:]
+                env[result] = self.call(arg1, args)
+            else:
+                env[result] = self._binary(op, self._value(arg1, env), self._value(arg2, env))
+            index += 1
+        return None
+
+    def _binary(self, op, left, right):
+        if op == '+':
+            return left + right
+        if op == '-':
+            return left - right
+        if op == '*':
+            return left * right
+        if op == '/':
+            if right == 0:
+                raise Exception("Erro de Execução: Divisão por zero.")
+            return left / right
+        if op == '^':
+            if (isinstance(left, int) and isinstance(right, int) and abs(left) > 1
+                    and right * math.log2(abs(left)) > MAX_POWER_BITS):
+                raise Exception("Erro de Execução: Resultado da potência grande demais.")
+            result = left ** right
+            if isinstance(result, complex):
+                # Base negativa com expoente fracionário: a linguagem só tem números reais
+                raise Exception("Erro de Execução: Potência com resultado complexo.")
+            return result
+        raise Exception(f"Erro de Execução: Operação desconhecida '{op}'.")
+
+    def call(self, func_id, args):
+        """Chama uma função do usuário, consultando o cache quando a memoização está ativa."""
+        if func_id not in self.functions:
+            raise Exception(f"Erro de Execução: Função '{func_id}' não definida.")
+        if self.profiler is None:
+            return self._call(func_id, args)
+        self.profiler.enter(func_id)
+        try:
+            return self._call(func_id, args)
+        finally:
+            self.profiler.exit()
+
+    def _call(self, func_id, args):
+        if not self.memoize:
+            return self._invoke(func_id, args)
+
+        cache = self.caches.get(func_id)
+        if cache is None:
+            cache = FunctionCache(self.cache_size, self.min_hit_rate, self.warmup)
+            self.caches[func_id] = cache
+        if cache.bypassed:
+            return self._invoke(func_id, args)
+
+        # O tipo entra na chave para que f(1) e f(1.0) não compartilhem resultados
+        key = (tuple((type(arg), arg) for arg in args),
+               tuple((name, self.globals.get(name)) for name in self.free_names[func_id]))
+        value = cache.get(key)
+        if value is _MISS:
+            value = self._invoke(func_id, args)
+            cache.put(key, value)
+        return value
+
+    def _invoke(self, func_id, args):
+        params = self.function_signatures[func_id]['params']
+        env = dict(zip(params, args))
+        return self._run_block(self.functions[func_id], env)
+
+    def cache_stats(self):
+        """Estatísticas de memoização por função."""
+        return {func_id: cache.stats() for func_id, cache in self.caches.items()}
+
+# Exemplo de uso (para testes internos)
+if __name__ == '__main__':
+
+    print("Módulo de Execução de Código Intermediário pronto para integração.")
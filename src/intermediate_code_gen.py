@@ -1,17 +1,27 @@
 # src/intermediate_code_gen.py
 
+from .parser import Occurrence
+from .parallel import MIN_BATCH_NODES, map_batches, plan
+
 class IntermediateCodeGenerator:
     """Gera código intermediário (três endereços) a partir da AST."""
     def __init__(self):
         self.code = []
+        self.lines = [] # Linha de origem de cada instrução (paralela a self.code)
+        self.current_line = None
+        self.line_shift = 0 # Deslocamento de linha da Occurrence em geração
         self.temp_count = 0
         self.label_count = 0
         self.function_signatures = {} # Para armazenar as assinaturas das funções
+        self.templates = {} # Nó compartilhado -> código já gerado para ele
 
     def new_temp(self):
         """Gera uma nova variável temporária."""
         self.temp_count += 1
-        return f"t{self.temp_count}"
+        return self.temp_name(self.temp_count)
+
+    def temp_name(self, index):
+        return f"t{index}"
 
     def new_label(self):
         """Gera um novo rótulo."""
@@ -21,23 +31,120 @@ class IntermediateCodeGenerator:
     def emit(self, op, arg1, arg2, result):
         """Emite uma instrução de três endereços."""
         self.code.append((op, arg1, arg2, result))
+        self.lines.append(self.current_line)
 
-    def generate(self, ast):
+    def generate(self, ast, parallel=False, workers=None, min_batch_nodes=MIN_BATCH_NODES):
         """Inicia a geração de código a partir do nó raiz da AST."""
         print("--- Geração de Código Intermediário ---")
         self.code = []
+        self.lines = []
+        self.current_line = None
+        self.line_shift = 0
         self.temp_count = 0
         self.label_count = 0
         self.function_signatures = {}
-        self.visit(ast)
+        self.templates = {}
+        if parallel:
+            self.generate_parallel(ast, workers, min_batch_nodes)
+        else:
+            self.visit(ast)
         print("Geração de Código Intermediário Concluída.")
         return self.code
 
+    def generate_parallel(self, ast, workers=None, min_batch_nodes=MIN_BATCH_NODES):
+        """
+        Gera os blocos das funções em paralelo, com temporários numerados
+        localmente, e os intercala em ordem com o código global, renumerando os
+        temporários para obter exatamente o mesmo código da geração serial.
+        Sem ganho possível com processos (ver plan), a geração é serial.
+        """
+        statements = ast.children[0].children
+        functions = [position for position, statement in enumerate(statements) if statement.type == 'DeclaracaoFuncao']
+        batches = plan(statements, functions, workers, min_batch_nodes)
+        if batches is None:
+            self.visit(ast)
+            return
+
+        blocks = iter(map_batches(_generate_function_blocks, statements, batches, workers=workers))
+        for statement in statements:
+            if statement.type != 'DeclaracaoFuncao':
+                self.visit(statement)
+                continue
+            code, lines, temp_count, func_id, signature = next(blocks)
+            offset = self.temp_count
+            for op, arg1, arg2, result in code:
+                self.code.append((op, _renumber(arg1, offset), _renumber(arg2, offset), _renumber(result, offset)))
+            self.lines.extend(lines)
+            self.temp_count += temp_count
+            self.function_signatures[func_id] = signature
+
     def visit(self, node):
         """Método genérico de visita."""
+        if type(node) is Occurrence:
+            return self.visit_occurrence(node)
+        if node.shared and node.children:
+            return self.visit_shared(node)
+        return self.dispatch(node)
+
+    def visit_occurrence(self, occurrence):
+        """As instruções de uma subárvore compartilhada recebem as linhas desta ocorrência."""
+        shift = self.line_shift
+        self.line_shift = shift + occurrence.lineno - occurrence.node.lineno
+        result = self.visit(occurrence.node)
+        self.line_shift = shift
+        return result
+
+    def visit_shared(self, node):
+        """
+        Subárvore compartilhada (hash-consing): o código é gerado na primeira
+        visita e reemitido nas seguintes, com os temporários renumerados.
+        """
+        template = self.templates.get(node)
+        if template is not None:
+            return self.replay(template)
+        start, first_temp = len(self.code), self.temp_count
+        result = self.dispatch(node)
+        # Temporários criados pela subárvore passam a ser relativos ao seu início
+        # (deslocamento a partir de 1; 0 indica um operando que não é temporário)
+        offsets = {self.temp_name(index): index - first_temp
+                   for index in range(first_temp + 1, self.temp_count + 1)}
+        code = [(op, arg1, arg2, res, offsets.get(arg1, 0), offsets.get(arg2, 0), offsets.get(res, 0))
+                for op, arg1, arg2, res in self.code[start:]]
+        # Linhas relativas ao nó canônico, deslocadas a cada reemissão
+        lines = self.shift_lines(self.lines[start:], -self.line_shift)
+        self.templates[node] = (code, lines, self.temp_count - first_temp, result, offsets.get(result, 0))
+        return result
+
+    def replay(self, template):
+        code, lines, temp_count, result, result_offset = template
+        # Cada temporário é criado uma vez e compartilhado entre definição e usos
+        names = [None] + [self.temp_name(self.temp_count + offset) for offset in range(1, temp_count + 1)]
+        append = self.code.append
+        for op, arg1, arg2, res, offset1, offset2, offset3 in code:
+            append((op,
+                    names[offset1] if offset1 else arg1,
+                    names[offset2] if offset2 else arg2,
+                    names[offset3] if offset3 else res))
+        self.lines.extend(self.shift_lines(lines, self.line_shift))
+        self.temp_count += temp_count
+        return names[result_offset] if result_offset else result
+
+    def shift_lines(self, lines, shift):
+        if not shift:
+            return lines
+        return [line + shift if line is not None else None for line in lines]
+
+    def dispatch(self, node):
         method_name = 'visit_' + node.type
         visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        if node.lineno is None:
+            return visitor(node)
+        # Instruções emitidas para este nó herdam a sua linha de origem
+        previous_line = self.current_line
+        self.current_line = node.lineno + self.line_shift
+        result = visitor(node)
+        self.current_line = previous_line
+        return result
 
     def generic_visit(self, node):
         """Visita todos os filhos de um nó."""
@@ -140,6 +247,30 @@ class IntermediateCodeGenerator:
         # Não gera código
         pass
 
+# Geração paralela dos blocos de função
+
+class _FunctionBlockGenerator(IntermediateCodeGenerator):
+    def temp_name(self, index):
+        """Temporário local ao bloco ('%n' não colide com identificadores), renumerado na junção."""
+        return f"%{index}"
+
+def _renumber(value, offset):
+    if isinstance(value, str) and value[0] == '%':
+        return f"t{int(value[1:]) + offset}"
+    return value
+
+def _generate_function_blocks(statements, batch, context):
+    """Gera o bloco de cada função de um lote, com temporários locais."""
+    blocks = []
+    for position in batch:
+        node = statements[position]
+        generator = _FunctionBlockGenerator()
+        generator.visit(node)
+        func_id = node.children[0].leaf
+        blocks.append((generator.code, generator.lines, generator.temp_count,
+                       func_id, generator.function_signatures[func_id]))
+    return blocks
+
 # Exemplo de uso (para testes internos)
 if __name__ == '__main__':
     
@@ -1,6 +1,7 @@
 # src/lexer.py
 
 import ply.lex as lex
+from .diagnostics import diagnostic, find_column
 
 # Lista de palavras reservadas
 reserved = {
@@ -64,11 +65,13 @@ def t_newline(t):
 
 # Tratamento de erros
 def t_error(t):
-    print(f"Caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
+    column = find_column(t.lexer.lexdata, t.lexpos)
+    t.lexer.diagnostics.append(diagnostic('lexico', f"Erro Léxico: Caractere ilegal '{t.value[0]}'.", t.lexer.lineno, column))
     t.lexer.skip(1)
 
 # Constrói o lexer
 lexer = lex.lex()
+lexer.diagnostics = [] # Erros léxicos (e sintáticos, quando usado pelo parser)
 
 if __name__ == '__main__':
     data = """
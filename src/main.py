@@ -7,9 +7,13 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.lexer import lexer
-from src.parser import parser, Node
+from src.parser import parser, parse, Node
 from src.semantic_analyzer import SemanticAnalyzer
 from src.intermediate_code_gen import IntermediateCodeGenerator
+from src.executor import Executor
+from src.profiler import Profiler
+from src.diagnostics import format_diagnostic
+from src.parallel import plan
 
 def print_ast(node, level=0):
     """Função auxiliar para imprimir a AST (apenas para debug)"""
@@ -19,36 +23,97 @@ def print_ast(node, level=0):
     for child in node.children:
         print_ast(child, level + 1)
 
-def compile_code(code):
-    """Função principal para compilar o código."""
+def print_cache_stats(stats):
+    """Exibe as estatísticas de memoização por função."""
+    print("\n--- Memoização ---")
+    for func_id, func_stats in stats.items():
+        status = " (desativado)" if func_stats['bypassed'] else ""
+        print(f"{func_id}: {func_stats['hits']} acertos, {func_stats['misses']} falhas, "
+              f"{func_stats['evictions']} descartes, taxa {func_stats['hit_rate']:.0%}{status}")
+
+def print_diagnostics(diagnostics):
+    """Exibe os diagnósticos em ordem de posição no código; erros sem posição por último."""
+    print(f"\n--- Diagnósticos ({len(diagnostics)}) ---")
+    diagnostics.sort(key=lambda entry: (entry['line'] is None, entry['line'] or 0, entry['column'] or 0))
+    for entry in diagnostics:
+        print(format_diagnostic(entry))
+
+def run_program(intermediate_code, code_generator, memoize=False, cache_size=128, min_hit_rate=0.1,
+                warmup=64, profile=False, profile_json=None, profile_sort='exclusive'):
+    """
+    Executa o código intermediário. Erros de execução são reportados à parte
+    e não alteram o resultado da compilação.
+    """
+    profiler = Profiler(intermediate_code, code_generator.lines) if profile or profile_json else None
+    executor = Executor(intermediate_code, code_generator.function_signatures, memoize=memoize,
+                        cache_size=cache_size, min_hit_rate=min_hit_rate, warmup=warmup, profiler=profiler)
+    try:
+        variables = executor.run()
+    except Exception as e:
+        print(e)
+        return None
+    for name, value in variables.items():
+        print(f"{name} = {value}")
+    if memoize:
+        print_cache_stats(executor.cache_stats())
+    if profile:
+        print()
+        print(profiler.report(sort_by=profile_sort))
+    if profile_json:
+        try:
+            profiler.write_json(profile_json)
+            print(f"Perfil gravado em {profile_json}")
+        except OSError as e:
+            print(f"Erro ao gravar o perfil em {profile_json}: {e.strerror}")
+    return variables
+
+def compile_code(code, run=False, memoize=False, cache_size=128, min_hit_rate=0.1, warmup=64,
+                 profile=False, profile_json=None, profile_sort='exclusive', parallel=False, hash_cons=False):
+    """
+    Função principal para compilar o código. O programa só é executado com
+    run=True (implícito na memoização e no perfil, que dependem da execução).
+    """
     print("--- Análise Léxica e Sintática ---")
     try:
-        # 1. Análise Léxica e Sintática
-        ast = parser.parse(code, lexer=lexer)
+        # 1. Análise Léxica e Sintática (com recuperação de erros)
+        ast, diagnostics = parse(code, lexer, hash_cons=hash_cons)
         if not ast:
             print("Análise Sintática Falhou.")
+            print_diagnostics(diagnostics)
             return None
         
-        print("Análise Sintática Concluída com Sucesso. AST Gerada.")
+        if diagnostics:
+            print(f"Análise Sintática encontrou {len(diagnostics)} erro(s). AST Gerada com recuperação.")
+        else:
+            print("Análise Sintática Concluída com Sucesso. AST Gerada.")
         # print_ast(ast) # Descomentar para ver a AST
         
-        # 2. Análise Semântica
+        # 2. Análise Semântica (também com erros sintáticos, para reportar tudo numa só compilação)
         semantic_analyzer = SemanticAnalyzer()
-        semantic_analyzer.analyze(ast)
+        diagnostics = diagnostics + semantic_analyzer.analyze(ast, parallel=parallel)
+        if diagnostics:
+            print_diagnostics(diagnostics)
+            return None
         
         # 3. Geração de Código Intermediário
         code_generator = IntermediateCodeGenerator()
-        intermediate_code = code_generator.generate(ast)
+        intermediate_code = code_generator.generate(ast, parallel=parallel)
         
         print("\n--- Código Intermediário Gerado ---")
         for instruction in intermediate_code:
             print(f"({instruction[0]}, {instruction[1]}, {instruction[2]}, {instruction[3]})")
-            
-        return intermediate_code
         
     except Exception as e:
         print(f"Erro durante a análise: {e}")
         return None
+
+    # 4. Execução do Código Intermediário (opcional)
+    if run or memoize or profile or profile_json:
+        print()
+        run_program(intermediate_code, code_generator, memoize, cache_size, min_hit_rate, warmup,
+                    profile, profile_json, profile_sort)
+
+    return intermediate_code
     """Função principal para compilar o código."""
     print("--- Análise Léxica e Sintática ---")
     try:
@@ -65,17 +130,20 @@ def compile_code(code):
         print(f"Erro durante a análise: {e}")
         return None
 
-def run_tests(file_path, expected_to_fail=False):
+def read_test_program(file_path):
+    with open(file_path, 'r') as f:
+        code = f.read()
+    
+    # Remove linhas de comentário e vazias para não confundir o lexer/parser
+    lines = [line for line in code.split('\n') if line.strip() and not line.strip().startswith('#')]
+    return '\n'.join(lines)
+
+def run_tests(file_path, expected_to_fail=False, **options):
     print(f"\n--- Executando Teste: {file_path} (Esperado Falha: {expected_to_fail}) ---")
     try:
-        with open(file_path, 'r') as f:
-            code = f.read()
+        code_clean = read_test_program(file_path)
         
-        # Remove linhas de comentário e vazias para não confundir o lexer/parser
-        lines = [line for line in code.split('\n') if line.strip() and not line.strip().startswith('#')]
-        code_clean = '\n'.join(lines)
-        
-        result = compile_code(code_clean)
+        result = compile_code(code_clean, **options)
         
         if expected_to_fail and result is not None:
             print("ERRO: O teste deveria falhar, mas a compilação foi bem-sucedida.")
@@ -91,9 +159,125 @@ def run_tests(file_path, expected_to_fail=False):
     except Exception as e:
         print(f"Erro inesperado durante a execução do teste: {e}")
 
+def run_memo_test(file_path):
+    """
+    Executa o programa com memoização e um cache pequeno, verificando que há
+    descartes LRU, que o cache de uma função com baixa taxa de acertos é
+    desativado e que os resultados são os mesmos da execução sem cache.
+    """
+    print(f"\n--- Executando Teste de Memoização: {file_path} ---")
+    try:
+        ast, diagnostics = parse(read_test_program(file_path), lexer)
+        if diagnostics or SemanticAnalyzer().analyze(ast):
+            print("ERRO: O programa do teste de memoização não compila.")
+            return
+        code_generator = IntermediateCodeGenerator()
+        intermediate_code = code_generator.generate(ast)
+        expected = Executor(intermediate_code, code_generator.function_signatures).run()
+        executor = Executor(intermediate_code, code_generator.function_signatures, memoize=True,
+                            cache_size=2, min_hit_rate=0.5, warmup=4)
+        variables = executor.run()
+        stats = executor.cache_stats()
+        print_cache_stats(stats)
+
+        if variables != expected:
+            print("ERRO: Os resultados com memoização diferem da execução sem cache.")
+        elif not any(entry['evictions'] and not entry['bypassed'] for entry in stats.values()):
+            print("ERRO: Nenhum descarte LRU num cache ativo.")
+        elif not any(entry['bypassed'] for entry in stats.values()):
+            print("ERRO: Nenhum cache desativado por baixa taxa de acertos.")
+        else:
+            print("SUCESSO: Descartes LRU e desativação do cache verificados.")
+    except FileNotFoundError:
+        print(f"Erro: Arquivo de teste não encontrado em {file_path}")
+    except Exception as e:
+        print(f"Erro inesperado durante a execução do teste: {e}")
+
+def run_parallel_test(file_path, workers=2):
+    """
+    Força a análise e a geração paralelas (vários processos, lotes de uma
+    função) e verifica que diagnósticos, código, linhas de origem e assinaturas
+    são os mesmos do caminho serial, com e sem hash-consing.
+    """
+    print(f"\n--- Executando Teste Paralelo: {file_path} ---")
+    try:
+        code = read_test_program(file_path)
+        for hash_cons in (False, True):
+            results = []
+            for parallel in (False, True):
+                ast, diagnostics = parse(code, lexer, hash_cons=hash_cons)
+                diagnostics = diagnostics + SemanticAnalyzer().analyze(ast, parallel, workers, min_batch_nodes=1)
+                code_generator = IntermediateCodeGenerator()
+                intermediate_code = code_generator.generate(ast, parallel, workers, min_batch_nodes=1)
+                results.append((diagnostics, intermediate_code, code_generator.lines, code_generator.function_signatures))
+
+            statements = ast.children[0].children
+            functions = [position for position, statement in enumerate(statements) if statement.type == 'DeclaracaoFuncao']
+            if plan(statements, functions, workers, min_batch_nodes=1) is None:
+                print("ERRO: O programa não tem funções suficientes para mais de um lote.")
+                return
+            if results[0] != results[1]:
+                print(f"ERRO: O caminho paralelo difere do serial (hash_cons={hash_cons}).")
+                return
+        print("SUCESSO: Caminho paralelo idêntico ao serial.")
+    except FileNotFoundError:
+        print(f"Erro: Arquivo de teste não encontrado em {file_path}")
+    except Exception as e:
+        print(f"Erro inesperado durante a execução do teste: {e}")
+
+def option_value(args, name, convert, default):
+    """Valor de uma opção '--nome=valor' da linha de comando (ValueError se não puder ser convertido)."""
+    prefix = f"--{name}="
+    value = next((arg[len(prefix):] for arg in args if arg.startswith(prefix)), None)
+    if value is None:
+        return default
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"Valor inválido para --{name}: '{value}'.") from None
+
+def option_errors(options):
+    """Mensagens de erro para opções com valores fora do intervalo aceito."""
+    errors = []
+    if options['cache_size'] < 0:
+        errors.append(f"--cache-size deve ser maior ou igual a zero, encontrado {options['cache_size']}.")
+    if options['warmup'] < 0:
+        errors.append(f"--cache-warmup deve ser maior ou igual a zero, encontrado {options['warmup']}.")
+    if not 0 <= options['min_hit_rate'] <= 1:
+        errors.append(f"--cache-min-hit-rate deve estar entre 0 e 1, encontrado {options['min_hit_rate']}.")
+    if options['profile_sort'] not in Profiler.SORT_KEYS:
+        errors.append(f"Critério de ordenação do perfil inválido: '{options['profile_sort']}'. "
+                      f"Use um de: {', '.join(Profiler.SORT_KEYS)}.")
+    return errors
 
 def main_menu():
     import sys
+
+    # Opções de linha de comando: execução do programa compilado, memoização de chamadas,
+    # perfil de execução, análise/geração paralela dos corpos das funções e
+    # compartilhamento de subárvores
+    args = sys.argv[1:]
+    try:
+        options = {
+            'run': '--run' in args,
+            'memoize': '--memo' in args,
+            'cache_size': option_value(args, 'cache-size', int, 128),
+            'min_hit_rate': option_value(args, 'cache-min-hit-rate', float, 0.1),
+            'warmup': option_value(args, 'cache-warmup', int, 64),
+            'profile': '--profile' in args,
+            'profile_json': option_value(args, 'profile-json', str, None),
+            'profile_sort': option_value(args, 'profile-sort', str, 'exclusive'),
+            'parallel': '--parallel' in args,
+            'hash_cons': '--hash-cons' in args,
+        }
+    except ValueError as e:
+        print(e)
+        return
+    errors = option_errors(options)
+    if errors:
+        for error in errors:
+            print(error)
+        return
     
     while True:
         print("\n" + "="*30)
@@ -115,8 +299,11 @@ def main_menu():
 
         if escolha == '1':
             # Modo 1: Rodar Testes Automáticos
-            run_tests('tests/test_valid.txt', expected_to_fail=False)
-            run_tests('tests/test_invalid.txt', expected_to_fail=True)
+            run_tests('tests/test_valid.txt', expected_to_fail=False, **options)
+            run_tests('tests/test_invalid.txt', expected_to_fail=True, **options)
+            run_memo_test('tests/test_memo.txt')
+            run_parallel_test('tests/test_valid.txt')
+            run_parallel_test('tests/test_invalid.txt')
             
         elif escolha == '2':
             # Modo 2: Teste Manual Interativo
@@ -134,7 +321,7 @@ def main_menu():
                 continue
                 
             if codigo_interativo.strip():
-                compile_code(codigo_interativo)
+                compile_code(codigo_interativo, **options)
             else:
                 print("Nenhum código fornecido.")
                 
@@ -0,0 +1,84 @@
+# src/parallel.py
+
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
+import os
+from .parser import Occurrence
+
+# Trabalho mínimo de um lote, em nós da AST: abaixo disso, criar processos e
+# trocar mensagens custa mais do que verificar ou traduzir o próprio lote
+MIN_BATCH_NODES = 5000
+SAMPLE_SIZE = 32 # Funções amostradas para estimar o tamanho médio
+
+# Estado dos processos de trabalho: as sentenças chegam a cada processo uma única
+# vez (herdadas no fork ou pelo inicializador), e os lotes levam apenas posições
+_statements = None
+_context = None
+
+def _init_worker(statements, context):
+    global _statements, _context
+    _statements = statements
+    _context = context
+
+def _run_batch(task):
+    function, batch = task
+    return function(_statements, batch, _context)
+
+def plan(statements, positions, workers=None, min_batch_nodes=MIN_BATCH_NODES):
+    """
+    Lotes para map_batches, ou None quando processos não compensam: um único
+    processador ou trabalho para um único lote. Nesse caso o chamador segue o
+    caminho serial. min_batch_nodes é o trabalho mínimo de um lote (ver
+    MIN_BATCH_NODES); valores pequenos forçam vários lotes.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or not positions:
+        return None
+    # O tamanho médio das funções é estimado por amostragem, sem percorrer todas
+    sample = positions[::max(1, len(positions) // SAMPLE_SIZE)]
+    average = sum(count_nodes(statements[position]) for position in sample) / len(sample)
+    size = max(math.ceil(min_batch_nodes / average), math.ceil(len(positions) / (workers * 4)))
+    groups = batches(positions, size)
+    return groups if len(groups) > 1 else None
+
+def map_batches(function, statements, groups, context=None, workers=None):
+    """
+    Aplica function(statements, lote, context) a cada lote (ver plan) em
+    processos e retorna os resultados dos lotes concatenados, em ordem.
+    A função deve ser definida no nível de módulo, para ser enviada aos processos.
+    """
+    global _statements, _context
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # Os processos herdam as sentenças da memória do processo principal, sem serialização
+        _statements, _context = statements, context
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(statements, context))
+    results = []
+    try:
+        with pool:
+            for batch_results in pool.map(_run_batch, [(function, batch) for batch in groups]):
+                results.extend(batch_results)
+    finally:
+        _statements = _context = None
+    return results
+
+def batches(items, size):
+    """Divide os itens em lotes contíguos de até 'size' itens."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def count_nodes(node):
+    """Número de nós distintos da subárvore (subárvores compartilhadas contam uma vez)."""
+    seen = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is Occurrence:
+            node = node.node
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.extend(node.children)
+    return len(seen)
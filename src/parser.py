@@ -2,20 +2,108 @@
 
 import ply.yacc as yacc
 from .lexer import tokens # Importa os tokens do lexer
+from .diagnostics import diagnostic, find_column
 
 # Definição da Estrutura da Árvore de Sintaxe Abstrata (AST)
 class Node:
-    def __init__(self, type, children=None, leaf=None):
+    def __init__(self, type, children=None, leaf=None, lineno=None, column=None):
         self.type = type
         if children:
             self.children = children
         else:
             self.children = []
         self.leaf = leaf
+        self.lineno = lineno # Linha do token de origem (usada no perfil e nos diagnósticos)
+        self.column = column
+        self.shared = False # Nó reaproveitado em mais de um ponto da AST (modo hash-consing)
 
     def __repr__(self):
         return f"Node(type='{self.type}', leaf={self.leaf}, children={len(self.children)})"
 
+def _position(p, n):
+    """Linha e coluna do n-ésimo símbolo da produção, para os nós da AST."""
+    return {'lineno': p.lineno(n), 'column': find_column(p.lexer.lexdata, p.lexpos(n))}
+
+class Occurrence:
+    """
+    Ocorrência de uma subárvore compartilhada (modo hash-consing) numa posição
+    diferente da primeira: a estrutura é a do nó canônico, a posição é a desta
+    ocorrência.
+    """
+    __slots__ = ('node', 'lineno', 'column')
+
+    def __init__(self, node, lineno, column):
+        self.node = node
+        self.lineno = lineno
+        self.column = column
+
+    @property
+    def type(self):
+        return self.node.type
+
+    @property
+    def leaf(self):
+        return self.node.leaf
+
+    @property
+    def children(self):
+        return self.node.children
+
+    def __repr__(self):
+        return f"Occurrence({self.node!r}, lineno={self.lineno}, column={self.column})"
+
+def relocate(frame, lineno, column):
+    """
+    Posição, numa ocorrência, de um nó interno a uma subárvore compartilhada.
+    frame: (linha, coluna) do nó canônico seguidas das desta ocorrência, ou
+    None fora de uma ocorrência. A disposição relativa dos nós faz parte da
+    chave de compartilhamento, então só as colunas da linha da raiz mudam.
+    """
+    if frame is None or lineno is None:
+        return lineno, column
+    canonical_line, canonical_column, line, column_here = frame
+    if lineno == canonical_line:
+        return line, column_here + column - canonical_column
+    return line + lineno - canonical_line, column
+
+# Hash-consing: no modo ativado, subárvores de expressão com a mesma estrutura e
+# a mesma disposição relativa no código são construídas uma única vez e
+# compartilhadas na AST; cada reaproveitamento guarda apenas a sua posição.
+_interned = None # Estrutura -> nó; None quando o modo está desativado
+_function_params = None # Parâmetros da função cujo corpo está sendo analisado
+_last_statement = None # Posição no código da última sentença reduzida
+
+def _hash_cons(key, children, position, build):
+    """
+    Fora do modo hash-consing, apenas constrói o nó. No modo ativado, reaproveita
+    o nó já construído com esta estrutura e disposição, devolvendo uma Occurrence
+    com a posição atual.
+    """
+    if _interned is None:
+        return build()
+    lineno, column = position['lineno'], position['column']
+    for child in children:
+        # Filho canônico e posição em relação ao pai (coluna absoluta se estiver em outra linha)
+        canonical = child.node if type(child) is Occurrence else child
+        if child.lineno == lineno:
+            key += (canonical, 0, child.column - column)
+        else:
+            key += (canonical, child.lineno - lineno, child.column)
+    node = _interned.get(key)
+    if node is None:
+        node = _interned[key] = build()
+        return node
+    node.shared = True
+    return Occurrence(node, lineno, column)
+
+def _statement_reduced(p):
+    global _last_statement
+    _last_statement = p.lexpos(1)
+
+def _leave_function():
+    global _function_params
+    _function_params = None
+
 # Precedência de operadores (da menor para a maior)
 precedence = (
     ('left', 'SOMA', 'SUBTRACAO'),
@@ -52,20 +140,52 @@ def p_atribuicao(p):
     '''
     atribuicao : ID IGUAL expressao
     '''
-    p[0] = Node('Atribuicao', [Node('ID', leaf=p[1]), p[3]])
+    p[0] = Node('Atribuicao', [Node('ID', leaf=p[1], **_position(p, 1)), p[3]], **_position(p, 1))
+    _statement_reduced(p)
 
 def p_declaracao_funcao(p):
     '''
     declaracao_funcao : FUNCAO ID ABRE_PARENTESES parametros_formais FECHA_PARENTESES IGUAL expressao
     '''
-    p[0] = Node('DeclaracaoFuncao', [Node('ID', leaf=p[2]), p[4], p[7]])
+    p[0] = Node('DeclaracaoFuncao', [Node('ID', leaf=p[2], **_position(p, 2)), p[4], p[7]], **_position(p, 1))
+    _statement_reduced(p)
+    _leave_function()
+
+# Recuperação de erros: a análise é retomada no início da próxima sentença.
+# Atribuições e declarações com a expressão inválida mantêm o nome declarado,
+# evitando erros em cascata na análise semântica.
+
+def p_sentenca_erro(p):
+    '''
+    sentenca : error
+    '''
+    p[0] = Node('Erro')
+    _leave_function()
+
+def p_atribuicao_erro(p):
+    '''
+    atribuicao : ID IGUAL error
+    '''
+    p[0] = Node('Atribuicao', [Node('ID', leaf=p[1], **_position(p, 1)), Node('Erro')], **_position(p, 1))
+    _statement_reduced(p)
+
+def p_declaracao_funcao_erro(p):
+    '''
+    declaracao_funcao : FUNCAO ID ABRE_PARENTESES parametros_formais FECHA_PARENTESES IGUAL error
+    '''
+    p[0] = Node('DeclaracaoFuncao', [Node('ID', leaf=p[2], **_position(p, 2)), p[4], Node('Erro')], **_position(p, 1))
+    _statement_reduced(p)
+    _leave_function()
 
 def p_parametros_formais(p):
     '''
     parametros_formais : lista_ids
                        | empty
     '''
+    global _function_params
     p[0] = p[1]
+    # Reduzido antes do corpo: os IDs do corpo sabem se são parâmetros ou globais
+    _function_params = {child.leaf for child in p[1].children}
 
 def p_lista_ids(p):
     '''
@@ -73,9 +193,9 @@ def p_lista_ids(p):
               | ID
     '''
     if len(p) == 4:
-        p[0] = Node('ListaIDs', [Node('ID', leaf=p[1])] + p[3].children)
+        p[0] = Node('ListaIDs', [Node('ID', leaf=p[1], **_position(p, 1))] + p[3].children)
     else:
-        p[0] = Node('ListaIDs', [Node('ID', leaf=p[1])])
+        p[0] = Node('ListaIDs', [Node('ID', leaf=p[1], **_position(p, 1))])
 
 def p_expressao_binaria(p):
     '''
@@ -85,13 +205,17 @@ def p_expressao_binaria(p):
               | expressao DIVISAO expressao
               | expressao POTENCIA expressao
     '''
-    p[0] = Node('OperacaoBinaria', [p[1], p[3]], leaf=p[2])
+    position = _position(p, 2)
+    p[0] = _hash_cons(('OperacaoBinaria', p[2]), [p[1], p[3]], position,
+                      lambda: Node('OperacaoBinaria', [p[1], p[3]], leaf=p[2], **position))
 
 def p_expressao_unaria(p):
     '''
     expressao : SUBTRACAO expressao %prec SOMA
     '''
-    p[0] = Node('OperacaoUnaria', [p[2]], leaf=p[1])
+    position = _position(p, 1)
+    p[0] = _hash_cons(('OperacaoUnaria', p[1]), [p[2]], position,
+                      lambda: Node('OperacaoUnaria', [p[2]], leaf=p[1], **position))
 
 def p_expressao_grupo(p):
     '''
@@ -104,19 +228,27 @@ def p_expressao_numero(p):
     expressao : NUM_INT
               | NUM_FLOAT
     '''
-    p[0] = Node('Literal', leaf=p[1])
+    # O tipo entra na chave para que 2 e 2.0 continuem distintos
+    position = _position(p, 1)
+    p[0] = _hash_cons(('Literal', type(p[1]), p[1]), [], position,
+                      lambda: Node('Literal', leaf=p[1], **position))
 
 def p_expressao_id(p):
     '''
     expressao : ID
     '''
-    p[0] = Node('ID', leaf=p[1])
+    # O escopo entra na chave: um parâmetro não é o mesmo símbolo que um global homônimo
+    position = _position(p, 1)
+    p[0] = _hash_cons(('ID', p[1], _function_params is not None and p[1] in _function_params), [], position,
+                      lambda: Node('ID', leaf=p[1], **position))
 
 def p_expressao_chamada_funcao(p):
     '''
     expressao : ID ABRE_PARENTESES argumentos FECHA_PARENTESES
     '''
-    p[0] = Node('ChamadaFuncao', [Node('ID', leaf=p[1]), p[3]])
+    position = _position(p, 1)
+    p[0] = _hash_cons(('ChamadaFuncao', p[1], p[3].type), p[3].children, position,
+                      lambda: Node('ChamadaFuncao', [Node('ID', leaf=p[1], **position), p[3]], **position))
 
 def p_argumentos(p):
     '''
@@ -141,15 +273,91 @@ def p_empty(p):
     '''
     p[0] = Node('Empty')
 
-# Tratamento de erros sintáticos
+UNEXPECTED_EOF = "Erro Sintático: Fim de arquivo inesperado."
+
+# Tratamento de erros sintáticos (reportados pelo chamador a partir dos diagnósticos)
 def p_error(p):
     if p:
-        print(f"Erro de sintaxe no token '{p.value}' na linha {p.lineno}")
+        column = find_column(p.lexer.lexdata, p.lexpos)
+        parser.diagnostics.append(diagnostic('sintatico', f"Erro Sintático: Token inesperado '{p.value}'.", p.lineno, column))
     else:
-        print("Erro de sintaxe no final do arquivo")
+        parser.diagnostics.append(diagnostic('sintatico', UNEXPECTED_EOF, *_end_position(parser.source)))
+
+def _end_position(code):
+    """Linha e coluna logo após o último token do código."""
+    end = len(code.rstrip())
+    return code.count('\n', 0, end) + 1, find_column(code, end)
 
 # Constrói o parser
 parser = yacc.yacc()
+parser.diagnostics = []
+parser.source = ""
+
+def parse(code, lexer, hash_cons=False):
+    """
+    Analisa o código e retorna a AST e a lista de diagnósticos léxicos e
+    sintáticos, em ordem. Com erros de sintaxe, a AST contém nós 'Erro' no
+    lugar das sentenças inválidas.
+
+    Se o arquivo terminar no meio de uma sentença, o PLY desiste no fim da
+    entrada; o código é então reanalisado uma única vez, até o início da
+    sentença incompleta (a primeira depois da última sentença reduzida), para
+    que as sentenças completas ainda cheguem à análise semântica. A AST só é
+    None se não houver sentença completa antes dela.
+
+    Com hash_cons=True, expressões idênticas (literais, IDs, operações e
+    chamadas) são compartilhadas; os reaproveitamentos aparecem na AST como
+    Occurrence, com a sua própria linha e coluna.
+    """
+    ast, diagnostics = _parse(code, lexer, hash_cons)
+    if ast is not None:
+        return ast, diagnostics
+    # Durante a recuperação de um erro anterior o PLY não chama p_error no fim da entrada
+    if not any(entry['message'] == UNEXPECTED_EOF for entry in diagnostics):
+        diagnostics.append(diagnostic('sintatico', UNEXPECTED_EOF, *_end_position(code)))
+
+    last = _last_statement if _last_statement is not None else -1
+    start = next((start for start in _statement_starts(code, lexer) if start > last), None)
+    if not start:
+        return None, diagnostics
+    ast, prefix_diagnostics = _parse(code[:start], lexer, hash_cons)
+    if ast is None:
+        return None, diagnostics
+    # Erros do prefixo vêm da nova análise; os da sentença descartada (e o de
+    # fim de arquivo), da análise completa
+    position = (code.count('\n', 0, start) + 1, find_column(code, start))
+    rest = [entry for entry in diagnostics if (entry['line'], entry['column']) >= position]
+    return ast, prefix_diagnostics + rest
+
+def _parse(code, lexer, hash_cons):
+    global _interned, _function_params, _last_statement
+    lexer.lineno = 1 # O lexer é compartilhado entre compilações
+    lexer.diagnostics = []
+    parser.diagnostics = lexer.diagnostics
+    parser.source = code # Para a posição do erro de fim de arquivo
+    _interned = {} if hash_cons else None
+    _function_params = None
+    _last_statement = None
+    try:
+        ast = parser.parse(code, lexer=lexer)
+    finally:
+        _interned = None
+    return ast, lexer.diagnostics
+
+def _statement_starts(code, lexer):
+    """Posições no código dos tokens que iniciam uma sentença ('funcao' ou 'ID =')."""
+    lexer.lineno = 1
+    lexer.diagnostics = []
+    lexer.input(code)
+    starts = []
+    previous = None
+    for token in iter(lexer.token, None):
+        if token.type == 'FUNCAO':
+            starts.append(token.lexpos)
+        elif token.type == 'IGUAL' and previous is not None and previous.type == 'ID':
+            starts.append(previous.lexpos)
+        previous = token
+    return starts
 
 if __name__ == '__main__':
     from .lexer import lexer
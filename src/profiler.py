@@ -0,0 +1,115 @@
+# src/profiler.py
+
+import json
+import time
+
+class Profiler:
+    """Coleta contagens e tempos durante a execução do código intermediário."""
+    SORT_KEYS = ('calls', 'inclusive', 'exclusive') # Critérios de ordenação das funções
+
+    def __init__(self, code, lines=None):
+        self.code = code
+        self.lines = lines if lines is not None else [None] * len(code) # Linha de origem de cada instrução
+        self.reset()
+
+    def reset(self):
+        self.instruction_counts = [0] * len(self.code)
+        self.functions = {} # Rótulo FUNC_* -> chamadas e tempos
+        self.total_time = 0.0
+        self._stack = [] # Quadros ativos: [rótulo, início, tempo dos filhos]
+        self._depth = {} # Profundidade de recursão por rótulo
+
+    def start(self):
+        self.reset()
+        self._started = time.perf_counter()
+
+    def stop(self):
+        self.total_time = time.perf_counter() - self._started
+
+    def enter(self, func_id):
+        """Registra o início de uma chamada de função."""
+        label = f"FUNC_{func_id}"
+        entry = self.functions.get(label)
+        if entry is None:
+            entry = {'calls': 0, 'inclusive': 0.0, 'exclusive': 0.0}
+            self.functions[label] = entry
+        entry['calls'] += 1
+        self._depth[label] = self._depth.get(label, 0) + 1
+        self._stack.append([label, time.perf_counter(), 0.0])
+
+    def exit(self):
+        """Registra o fim da chamada mais recente."""
+        label, started, child_time = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        entry = self.functions[label]
+        entry['exclusive'] += elapsed - child_time
+        self._depth[label] -= 1
+        # Em chamadas recursivas, o tempo inclusivo é contado apenas na chamada mais externa
+        if self._depth[label] == 0:
+            entry['inclusive'] += elapsed
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def opcode_counts(self):
+        """Número de execuções por operação."""
+        counts = {}
+        for (op, arg1, arg2, result), count in zip(self.code, self.instruction_counts):
+            if count:
+                counts[op] = counts.get(op, 0) + count
+        return counts
+
+    def hot_instructions(self, top=10):
+        """As instruções mais executadas, com a linha de origem de cada uma."""
+        indexes = [index for index, count in enumerate(self.instruction_counts) if count]
+        indexes.sort(key=lambda index: self.instruction_counts[index], reverse=True)
+        hot = []
+        for index in indexes[:top]:
+            op, arg1, arg2, result = self.code[index]
+            hot.append({
+                'index': index,
+                'instruction': f"({op}, {arg1}, {arg2}, {result})",
+                'line': self.lines[index],
+                'count': self.instruction_counts[index],
+            })
+        return hot
+
+    def function_stats(self, sort_by='exclusive'):
+        """Estatísticas por função, ordenadas por 'calls', 'inclusive' ou 'exclusive'."""
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Critério de ordenação inválido: '{sort_by}'.")
+        return sorted(self.functions.items(), key=lambda item: item[1][sort_by], reverse=True)
+
+    def report(self, sort_by='exclusive', top=10):
+        """Relatório em texto do perfil de execução."""
+        out = ["--- Perfil de Execução ---", f"Tempo total: {self.total_time * 1000:.3f} ms", ""]
+        out.append(f"{'Função':<24}{'Chamadas':>10}{'Inclusivo (ms)':>16}{'Exclusivo (ms)':>16}")
+        for label, entry in self.function_stats(sort_by):
+            out.append(f"{label:<24}{entry['calls']:>10}{entry['inclusive'] * 1000:>16.3f}{entry['exclusive'] * 1000:>16.3f}")
+        out.append("")
+        out.append(f"{'Operação':<24}{'Execuções':>10}")
+        for op, count in sorted(self.opcode_counts().items(), key=lambda item: item[1], reverse=True):
+            out.append(f"{op:<24}{count:>10}")
+        out.append("")
+        out.append(f"{'Instrução':<40}{'Linha':>8}{'Execuções':>12}")
+        for hot in self.hot_instructions(top):
+            line = hot['line'] if hot['line'] is not None else '-'
+            out.append(f"{hot['instruction']:<40}{line:>8}{hot['count']:>12}")
+        return "\n".join(out)
+
+    def to_dict(self, top=10):
+        return {
+            'total_time': self.total_time,
+            'functions': self.functions,
+            'opcodes': self.opcode_counts(),
+            'hot_instructions': self.hot_instructions(top),
+        }
+
+    def write_json(self, path, top=10):
+        """Grava o perfil em formato JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(top), f, indent=2)
+
+# Exemplo de uso (para testes internos)
+if __name__ == '__main__':
+
+    print("Módulo de Perfil de Execução pronto para integração.")
@@ -1,6 +1,12 @@
 # src/semantic_analyzer.py
 
 from collections import OrderedDict
+from .diagnostics import diagnostic
+from .parser import Occurrence, relocate
+from .parallel import MIN_BATCH_NODES, map_batches, plan
+
+# Tipo atribuído a expressões com erro, para não reportar o mesmo problema em cascata
+ERRO = 'ERRO'
 
 class SymbolTable:
     """Tabela de Símbolos para gerenciar escopo."""
@@ -22,23 +28,118 @@ class SymbolTable:
             return self.parent.lookup(name)
         return None
 
+class GlobalScopeView:
+    """Visão somente leitura do escopo global como era no ponto de declaração de uma função."""
+    def __init__(self, symbols, position):
+        self.symbols = symbols # nome -> (tipo, número de parâmetros, posição da declaração)
+        self.position = position
+
+    def lookup(self, name):
+        entry = self.symbols.get(name)
+        if entry is None or entry[2] > self.position:
+            return None
+        type, params, _ = entry
+        return {'type': type, 'details': {'params': params} if type == 'FUNCAO' else {}}
+
 class SemanticAnalyzer:
     """Analisador Semântico que percorre a AST para verificação de tipos e escopo."""
     def __init__(self):
         self.global_scope = SymbolTable()
         self.current_scope = self.global_scope
+        self.diagnostics = []
+        self.scope_key = None # Parâmetros da função em análise (None no escopo global)
+        self.shared_types = {} # (nó compartilhado, escopo) -> tipo já verificado
+        self.frame = None # Posições do nó canônico e da Occurrence em análise (ver relocate)
 
-    def analyze(self, ast):
-        """Inicia a análise semântica a partir do nó raiz da AST."""
+    def analyze(self, ast, parallel=False, workers=None, min_batch_nodes=MIN_BATCH_NODES):
+        """
+        Inicia a análise semântica a partir do nó raiz da AST. Os erros são
+        coletados em vez de interromper a análise; retorna a lista de diagnósticos.
+        """
         print("--- Análise Semântica ---")
-        self.visit(ast)
-        print("Análise Semântica Concluída com Sucesso.")
+        self.diagnostics = []
+        if parallel:
+            self.analyze_parallel(ast, workers, min_batch_nodes)
+        else:
+            self.visit(ast)
+        if self.diagnostics:
+            print(f"Análise Semântica encontrou {len(self.diagnostics)} erro(s).")
+        else:
+            print("Análise Semântica Concluída com Sucesso.")
+        return self.diagnostics
+
+    def analyze_parallel(self, ast, workers=None, min_batch_nodes=MIN_BATCH_NODES):
+        """
+        Análise em duas etapas: as sentenças são percorridas em ordem registrando
+        as assinaturas e variáveis globais, e os corpos das funções são verificados
+        depois, em paralelo. Os diagnósticos saem na mesma ordem da análise serial.
+        Sem ganho possível com processos (ver plan), a análise é serial.
+        """
+        statements = ast.children[0].children
+        functions = [position for position, statement in enumerate(statements) if statement.type == 'DeclaracaoFuncao']
+        batches = plan(statements, functions, workers, min_batch_nodes)
+        if batches is None:
+            self.visit(ast)
+            return
+        symbols = self.global_scope.symbols
+        positions = {}
+        diagnostics = [] # (posição da sentença, etapa, diagnóstico)
+
+        # 1. Assinaturas das funções e sentenças globais, em ordem
+        for position, statement in enumerate(statements):
+            size = len(symbols)
+            self.diagnostics = []
+            if statement.type == 'DeclaracaoFuncao':
+                self.declare_function(statement)
+            else:
+                self.visit(statement)
+            diagnostics.extend((position, 0, entry) for entry in self.diagnostics)
+            if len(symbols) > size:
+                positions[next(reversed(symbols))] = position
+
+        # 2. Corpos das funções, em lotes distribuídos entre os processos
+        snapshot = {name: (symbols[name]['type'], symbols[name]['details'].get('params'), position)
+                    for name, position in positions.items()}
+        diagnostics.extend(map_batches(_check_function_bodies, statements, batches, snapshot, workers))
+
+        # A ordenação é estável: dentro de uma mesma etapa, preserva a ordem de visita
+        diagnostics.sort(key=lambda item: (item[0], item[1]))
+        self.diagnostics = [entry for _, _, entry in diagnostics]
+
+    def error(self, node, message):
+        """Registra um erro semântico na posição do nó e retorna o tipo ERRO."""
+        line, column = relocate(self.frame, node.lineno, node.column)
+        self.diagnostics.append(diagnostic('semantico', message, line, column))
+        return ERRO
 
     def visit(self, node):
         """Método genérico de visita."""
+        if type(node) is Occurrence:
+            return self.visit_occurrence(node)
         method_name = 'visit_' + node.type
         visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        if not (node.shared and node.children):
+            return visitor(node)
+
+        # Subárvore compartilhada (hash-consing): só resultados sem erro são
+        # reaproveitados, pois símbolos globais e assinaturas nunca deixam de existir
+        key = (node, self.scope_key)
+        expr_type = self.shared_types.get(key)
+        if expr_type is None:
+            count = len(self.diagnostics)
+            expr_type = visitor(node)
+            if len(self.diagnostics) == count:
+                self.shared_types[key] = expr_type
+        return expr_type
+
+    def visit_occurrence(self, occurrence):
+        """Os erros dentro de uma subárvore compartilhada são reportados nas posições desta ocorrência."""
+        frame = self.frame
+        line, column = relocate(frame, occurrence.lineno, occurrence.column)
+        self.frame = (occurrence.node.lineno, occurrence.node.column, line, column)
+        expr_type = self.visit(occurrence.node)
+        self.frame = frame
+        return expr_type
 
     def generic_visit(self, node):
         """Visita todos os filhos de um nó."""
@@ -51,6 +152,10 @@ class SemanticAnalyzer:
     def visit_Sentencas(self, node):
         self.generic_visit(node)
 
+    def visit_Erro(self, node):
+        # Sentença ou expressão inválida, já reportada pelo parser
+        return ERRO
+
     def visit_Atribuicao(self, node):
         var_id = node.children[0].leaf
         expr_type = self.visit(node.children[1])
@@ -60,55 +165,74 @@ class SemanticAnalyzer:
             self.global_scope.insert(var_id, 'NUMERICO')
         
         # A verificação de tipo é simplificada para 'NUMERICO'
-        if expr_type != 'NUMERICO':
-            raise Exception(f"Erro Semântico: Atribuição de tipo incompatível para '{var_id}'. Esperado NUMERICO, encontrado {expr_type}.")
+        if expr_type not in ('NUMERICO', ERRO):
+            return self.error(node.children[0], f"Erro Semântico: Atribuição de tipo incompatível para '{var_id}'. Esperado NUMERICO, encontrado {expr_type}.")
         
         return 'NUMERICO'
 
     def visit_DeclaracaoFuncao(self, node):
-        func_id = node.children[0].leaf
-        params_node = node.children[1]
-        expr_node = node.children[2]
+        function_scope = self.declare_function(node)
+        self.check_function_body(node, function_scope)
+
+    def declare_function(self, node):
+        """Insere a função no escopo global e retorna o escopo dos seus parâmetros."""
+        id_node = node.children[0]
+        func_id = id_node.leaf
 
-        # 1. Insere a função no escopo global
-        if self.global_scope.lookup(func_id):
-            raise Exception(f"Erro Semântico: Função '{func_id}' já declarada.")
+        # 1. Insere a função no escopo global (uma redeclaração é reportada, mas o corpo ainda é analisado)
+        redeclared = self.global_scope.lookup(func_id) is not None
+        if redeclared:
+            self.error(id_node, f"Erro Semântico: Função '{func_id}' já declarada.")
         
-        # Cria um novo escopo para os parâmetros da função
+        function_scope = self.function_scope(node)
+        if not redeclared:
+            self.global_scope.insert(func_id, 'FUNCAO', {'params': len(node_params(node)), 'scope': function_scope})
+        return function_scope
+
+    def function_scope(self, node):
+        """Cria um novo escopo para os parâmetros da função."""
         function_scope = SymbolTable(parent=self.global_scope)
-        self.current_scope = function_scope
         
-        param_count = 0
-        if params_node.type == 'ListaIDs':
-            for param_id_node in params_node.children:
-                param_name = param_id_node.leaf
+        for param_id_node in node_params(node):
+            param_name = param_id_node.leaf
+            if param_name in function_scope.symbols:
+                self.error(param_id_node, f"Erro Semântico: Símbolo '{param_name}' já declarado neste escopo.")
+            else:
                 function_scope.insert(param_name, 'NUMERICO', {'kind': 'param'})
-                param_count += 1
-        
-        self.global_scope.insert(func_id, 'FUNCAO', {'params': param_count, 'scope': function_scope})
+        return function_scope
 
-        # 2. Analisa o corpo da função (expressão)
-        expr_type = self.visit(expr_node)
+    def check_function_body(self, node, function_scope):
+        """Analisa o corpo da função (expressão) no escopo dos seus parâmetros."""
+        func_id = node.children[0].leaf
+        self.current_scope = function_scope
+        self.scope_key = tuple(function_scope.symbols)
+        expr_type = self.visit(node.children[2])
         
-        if expr_type != 'NUMERICO':
-            raise Exception(f"Erro Semântico: Função '{func_id}' deve retornar um tipo NUMERICO.")
+        if expr_type not in ('NUMERICO', ERRO):
+            self.error(node.children[0], f"Erro Semântico: Função '{func_id}' deve retornar um tipo NUMERICO.")
 
         # Retorna ao escopo anterior
         self.current_scope = self.global_scope
+        self.scope_key = None
 
     def visit_OperacaoBinaria(self, node):
         left_type = self.visit(node.children[0])
         right_type = self.visit(node.children[1])
 
+        # Erros nos operandos já foram reportados
+        if left_type == ERRO or right_type == ERRO:
+            return ERRO
         if left_type != 'NUMERICO' or right_type != 'NUMERICO':
-            raise Exception(f"Erro Semântico: Operação binária com tipos incompatíveis: {left_type} {node.leaf} {right_type}")
+            return self.error(node, f"Erro Semântico: Operação binária com tipos incompatíveis: {left_type} {node.leaf} {right_type}")
         
         return 'NUMERICO'
 
     def visit_OperacaoUnaria(self, node):
         expr_type = self.visit(node.children[0])
+        if expr_type == ERRO:
+            return ERRO
         if expr_type != 'NUMERICO':
-            raise Exception(f"Erro Semântico: Operação unária com tipo incompatível: {expr_type}")
+            return self.error(node, f"Erro Semântico: Operação unária com tipo incompatível: {expr_type}")
         return 'NUMERICO'
 
     def visit_Literal(self, node):
@@ -118,39 +242,39 @@ class SemanticAnalyzer:
     def visit_ID(self, node):
         symbol = self.current_scope.lookup(node.leaf)
         if symbol is None:
-            raise Exception(f"Erro Semântico: Identificador '{node.leaf}' não declarado.")
+            return self.error(node, f"Erro Semântico: Identificador '{node.leaf}' não declarado.")
         
         if symbol['type'] == 'FUNCAO':
-            raise Exception(f"Erro Semântico: Uso de função '{node.leaf}' como variável.")
+            return self.error(node, f"Erro Semântico: Uso de função '{node.leaf}' como variável.")
             
         return symbol['type']
 
     def visit_ChamadaFuncao(self, node):
-        func_id = node.children[0].leaf
+        id_node = node.children[0]
+        func_id = id_node.leaf
         args_node = node.children[1]
-        
-        symbol = self.global_scope.lookup(func_id)
-        if symbol is None or symbol['type'] != 'FUNCAO':
-            raise Exception(f"Erro Semântico: Função '{func_id}' não declarada.")
-        
-        expected_params = symbol['details']['params']
-        
+
         actual_args = []
         if args_node.type == 'ListaExpressoes':
             actual_args = args_node.children
         
-        actual_params = len(actual_args)
-        
-        if actual_params != expected_params:
-            raise Exception(f"Erro Semântico: Chamada de função '{func_id}' com número incorreto de argumentos. Esperado {expected_params}, encontrado {actual_params}.")
+        symbol = self.global_scope.lookup(func_id)
+        result_type = 'NUMERICO' # Funções retornam NUMERICO
+        if symbol is None or symbol['type'] != 'FUNCAO':
+            result_type = self.error(id_node, f"Erro Semântico: Função '{func_id}' não declarada.")
+        else:
+            expected_params = symbol['details']['params']
+            actual_params = len(actual_args)
+            if actual_params != expected_params:
+                result_type = self.error(id_node, f"Erro Semântico: Chamada de função '{func_id}' com número incorreto de argumentos. Esperado {expected_params}, encontrado {actual_params}.")
             
-        # Verifica o tipo de cada argumento
+        # Verifica o tipo de cada argumento (também numa chamada inválida, para reportar erros internos)
         for arg_node in actual_args:
             arg_type = self.visit(arg_node)
-            if arg_type != 'NUMERICO':
-                raise Exception(f"Erro Semântico: Argumento de função deve ser NUMERICO, encontrado {arg_type}.")
+            if arg_type not in ('NUMERICO', ERRO):
+                self.error(arg_node, f"Erro Semântico: Argumento de função deve ser NUMERICO, encontrado {arg_type}.")
                 
-        return 'NUMERICO' # Funções retornam NUMERICO
+        return result_type
 
     def visit_ListaIDs(self, node):
         # Usado apenas na declaração de função, não precisa de verificação de tipo aqui
@@ -163,6 +287,28 @@ class SemanticAnalyzer:
     def visit_Empty(self, node):
         pass
 
+def node_params(node):
+    """Nós ID dos parâmetros de uma declaração de função."""
+    params_node = node.children[1]
+    return params_node.children if params_node.type == 'ListaIDs' else []
+
+# Função executada nos processos da análise paralela
+
+def _check_function_bodies(statements, batch, global_symbols):
+    """Verifica os corpos de um lote de funções, retornando os diagnósticos com a posição de cada uma."""
+    diagnostics = []
+    for position in batch:
+        node = statements[position]
+        analyzer = SemanticAnalyzer()
+        analyzer.global_scope = GlobalScopeView(global_symbols, position)
+        analyzer.diagnostics = []
+        function_scope = analyzer.function_scope(node)
+        # Erros nos parâmetros já foram reportados na primeira etapa
+        analyzer.diagnostics = []
+        analyzer.check_function_body(node, function_scope)
+        diagnostics.extend((position, 1, entry) for entry in analyzer.diagnostics)
+    return diagnostics
+
 # Exemplo de uso (para testes internos)
 if __name__ == '__main__':
     # Este módulo não deve ser executado diretamente, mas sim integrado ao main.py